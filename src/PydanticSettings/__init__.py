@@ -1,9 +1,21 @@
-from .core import PydanticSettings, EnvironmentSettings, pydantic_settings
-from .cli import PydanticSettingsCLI
-from .utils import export_settings
-from .testing import unit_testing
+from importlib import import_module
+from typing import Any
+
+# `help` shares its name with its submodule, so it must be bound eagerly; the
+# import system would otherwise set the package attribute to the module itself.
 from .help import help
 
+# Other public names are resolved lazily (PEP 562) so importing the package does
+# not pull in click, PyYAML, cryptography or dotenv until they are actually used.
+_LAZY_ATTRS = {
+    "PydanticSettings": ".core",
+    "EnvironmentSettings": ".core",
+    "pydantic_settings": ".core",
+    "PydanticSettingsCLI": ".cli",
+    "export_settings": ".utils",
+    "unit_testing": ".testing",
+}
+
 __all__ = [
     "PydanticSettings",
     "EnvironmentSettings",
@@ -13,3 +25,22 @@ __all__ = [
     "unit_testing",
     "help",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    try:
+        module = import_module(module_name, __name__)
+    except AttributeError as exc:
+        # `from PydanticSettings import X` would otherwise report this as
+        # "cannot import name X" and hide the error raised by the submodule.
+        raise ImportError(f"error while importing {__name__}{module_name}: {exc}") from exc
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
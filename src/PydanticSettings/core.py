@@ -1,16 +1,219 @@
+import io
 import os
+import base64
+import copy
+import asyncio
 import json
-import yaml
 import logging
-from typing import Any, Dict
+import functools
+from typing import (
+    TYPE_CHECKING, Any, Awaitable, Callable, Dict, FrozenSet, List, Mapping, Optional, Tuple, TypeVar
+)
+from pydantic import create_model
+from pydantic_core import SchemaValidator
 from pydantic_settings import BaseSettings
-from dotenv import dotenv_values
-from cryptography.fernet import Fernet
+
+if TYPE_CHECKING:
+    from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+
+_T = TypeVar("_T")
 
 # Logging setup
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("Pydantic_Settings")
 
+# Opt-in switch to skip Pydantic validation in `load_env` (see its docstring).
+_TRUSTED = os.environ.get("PYDANTIC_SETTINGS_TRUSTED") == "1"
+
+# Upper bound on concurrent per-secret requests, to stay under secrets manager rate limits.
+_MAX_SECRET_REQUESTS = 10
+
+# Encrypted env files are `nonce || AES-GCM ciphertext`.
+_NONCE_SIZE = 12
+# Every Fernet token starts with this prefix; used to decrypt files written before AES-GCM.
+_FERNET_PREFIX = b"gAAAAA"
+
+# Compiled `.env` validators, keyed by the set of `EnvironmentSettings` fields in the file.
+_VALIDATOR_CACHE: Dict[FrozenSet[str], SchemaValidator] = {}
+
+_READ_FLAGS = os.O_RDONLY | getattr(os, "O_CLOEXEC", 0) | getattr(os, "O_BINARY", 0)
+
+
+def _read_file_bytes(path: str) -> bytes:
+    """
+    Read a whole file as bytes with unbuffered `os.read` calls sized from `os.fstat`.
+    """
+    try:
+        fd = os.open(path, _READ_FLAGS | getattr(os, "O_NOATIME", 0))
+    except PermissionError:
+        # O_NOATIME is only allowed for the file's owner.
+        fd = os.open(path, _READ_FLAGS)
+    try:
+        remaining = os.fstat(fd).st_size
+        chunks = []
+        while remaining > 0:
+            chunk = os.read(fd, remaining)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            remaining -= len(chunk)
+        return chunks[0] if len(chunks) == 1 else b"".join(chunks)
+    finally:
+        os.close(fd)
+
+
+@functools.lru_cache(maxsize=16)
+def _load_yaml_cached(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """
+    Parse a YAML config file; `mtime_ns` and `size` only serve as cache keys.
+    """
+    import yaml
+
+    try:
+        from yaml import CSafeLoader as Loader
+    except ImportError:  # libyaml not available
+        from yaml import SafeLoader as Loader  # type: ignore
+
+    with open(path, "r") as file:
+        return yaml.load(file, Loader=Loader) or {}
+
+
+@functools.lru_cache(maxsize=16)
+def _load_json_cached(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """
+    Parse a JSON config file; `mtime_ns` and `size` only serve as cache keys.
+    """
+    with open(path, "r") as file:
+        return json.load(file)
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_dotenv_cached(path: str, mtime_ns: int, size: int) -> Dict[str, Optional[str]]:
+    """
+    Parse a `.env` file; `mtime_ns` and `size` only serve as cache keys.
+    """
+    from dotenv import dotenv_values
+
+    return dict(dotenv_values(path))
+
+
+def _parse_dotenv(path: str) -> Dict[str, Optional[str]]:
+    """
+    Parse a `.env` file, reusing the cached result while the file is unchanged.
+    """
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return {}
+    # Copy so callers never mutate the cached parse.
+    return dict(_parse_dotenv_cached(path, st.st_mtime_ns, st.st_size))
+
+
+def _parse_yaml(path: str) -> Dict[str, Any]:
+    """
+    Parse a YAML config file, reusing the cached result while the file is unchanged.
+    """
+    st = os.stat(path)
+    # Deep copy so nested mappings in `self.config` never alias the cached parse.
+    return copy.deepcopy(_load_yaml_cached(path, st.st_mtime_ns, st.st_size))
+
+
+def _parse_json(path: str) -> Dict[str, Any]:
+    """
+    Parse a JSON config file, reusing the cached result while the file is unchanged.
+    """
+    st = os.stat(path)
+    # Deep copy so nested mappings in `self.config` never alias the cached parse.
+    return copy.deepcopy(_load_json_cached(path, st.st_mtime_ns, st.st_size))
+
+
+async def _run_in_thread(func: Callable[..., _T], *args: Any, **kwargs: Any) -> _T:
+    """
+    Run blocking I/O in the default executor so the event loop stays responsive.
+    """
+    return await asyncio.get_running_loop().run_in_executor(
+        None, functools.partial(func, *args, **kwargs)
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _boto_client() -> Any:
+    """
+    Create the AWS Secrets Manager client once; importing boto3 is deferred until first use.
+    """
+    import boto3  # type: ignore
+    return boto3.client("secretsmanager")
+
+
+async def _gather_bounded(func: Callable[[str], Awaitable[_T]], names: List[str]) -> List[Any]:
+    """
+    Call `func` for each secret name concurrently, with at most `_MAX_SECRET_REQUESTS` in flight.
+
+    Exceptions are returned in place of results so one failing secret does not abort the rest.
+    """
+    semaphore = asyncio.Semaphore(_MAX_SECRET_REQUESTS)
+
+    async def fetch(name: str) -> _T:
+        async with semaphore:
+            return await func(name)
+
+    return await asyncio.gather(*(fetch(name) for name in names), return_exceptions=True)
+
+
+async def _fetch_azure_secrets(vault_url: Optional[str]) -> Dict[str, str]:
+    """
+    Fetch every enabled secret from an Azure Key Vault, requesting the values concurrently.
+    """
+    from azure.core.exceptions import HttpResponseError  # type: ignore
+    from azure.keyvault.secrets.aio import SecretClient  # type: ignore
+    from azure.identity.aio import DefaultAzureCredential  # type: ignore
+
+    async with DefaultAzureCredential() as credential, SecretClient(
+        vault_url=vault_url, credential=credential
+    ) as client:
+        names = [prop.name async for prop in client.list_properties_of_secrets() if prop.enabled]
+        responses = await _gather_bounded(client.get_secret, names)
+
+    secrets: Dict[str, str] = {}
+    for name, response in zip(names, responses):
+        if isinstance(response, HttpResponseError):
+            # Deleted since it was listed, or not readable with these credentials.
+            logger.warning(f"Skipping Azure secret '{name}': {response}")
+            continue
+        if isinstance(response, BaseException):
+            raise response
+        secrets[response.name] = response.value
+    return secrets
+
+
+async def _fetch_google_secrets(project_id: Optional[str]) -> Dict[str, str]:
+    """
+    Fetch the latest version of every secret in a Google Cloud project concurrently.
+    """
+    from google.api_core.exceptions import FailedPrecondition, NotFound  # type: ignore
+    from google.cloud import secretmanager  # type: ignore
+
+    async with secretmanager.SecretManagerServiceAsyncClient() as client:
+        pager = await client.list_secrets(parent=f"projects/{project_id}")
+        names = [secret.name async for secret in pager]
+        responses = await _gather_bounded(
+            lambda name: client.access_secret_version(name=f"{name}/versions/latest"), names
+        )
+
+    secrets: Dict[str, str] = {}
+    for name, response in zip(names, responses):
+        # Secret names are fully qualified (`projects/<id>/secrets/<name>`); keep the short name.
+        short_name = name.rsplit("/", 1)[-1]
+        if isinstance(response, (NotFound, FailedPrecondition)):
+            # No latest version, or it is disabled/destroyed.
+            logger.warning(f"Skipping Google secret '{short_name}': {response}")
+            continue
+        if isinstance(response, BaseException):
+            raise response
+        secrets[short_name] = response.payload.data.decode("UTF-8")
+    return secrets
+
+
 class EnvironmentSettings(BaseSettings):
     """
     Base class for strongly-typed environment settings.
@@ -25,6 +228,86 @@ class EnvironmentSettings(BaseSettings):
         env_file_encoding = "utf-8"
 
 
+_TRUE_STRINGS = frozenset({"1", "true", "yes", "on", "t", "y"})
+_FALSE_STRINGS = frozenset({"0", "false", "no", "off", "f", "n"})
+
+
+def _to_bool(value: Any) -> bool:
+    """
+    Cast a boolean or one of the recognised true/false strings; raise `ValueError` otherwise.
+    """
+    if isinstance(value, bool):
+        return value
+    text = str(value).lower()
+    if text in _TRUE_STRINGS:
+        return True
+    if text in _FALSE_STRINGS:
+        return False
+    raise ValueError(f"Cannot interpret {value!r} as a boolean.")
+
+
+def _to_int(value: Any) -> int:
+    """
+    Cast to `int` without truncating floats or accepting booleans; raise `ValueError` otherwise.
+    """
+    if isinstance(value, bool) or (isinstance(value, float) and not value.is_integer()):
+        raise ValueError(f"Cannot interpret {value!r} as an integer.")
+    return int(value)
+
+
+def _coercer_for(annotation: Any) -> Callable[[Any], Any]:
+    """
+    Pick a cheap Python cast for a field annotation; unknown types pass through unchanged.
+    """
+    if annotation is bool:
+        return _to_bool
+    if annotation is int:
+        return _to_int
+    if annotation in (float, str):
+        return annotation
+    return lambda value: value
+
+
+# Field name -> cast, computed once so `_coerce_trusted` never walks the model fields.
+_FIELD_COERCERS: Dict[str, Callable[[Any], Any]] = {
+    name: _coercer_for(field.annotation) for name, field in EnvironmentSettings.model_fields.items()
+}
+
+
+def _fold_case(*sources: Mapping[str, Any]) -> Dict[str, Any]:
+    """
+    Lower-case the keys of setting sources given from highest to lowest priority.
+
+    `BaseSettings` matches field names case-insensitively, so `PORT` in secrets and
+    `port` in YAML name the same setting; the highest-priority source must win.
+    """
+    folded: Dict[str, Any] = {}
+    for source in sources:
+        for key, value in source.items():
+            folded.setdefault(key.lower(), value)
+    return folded
+
+
+def _coerce_trusted(*sources: Mapping[str, Any]) -> Dict[str, Any]:
+    """
+    Cheaply cast trusted, already-parsed values onto `EnvironmentSettings` fields.
+
+    Sources are given from highest to lowest priority and keys are matched
+    case-insensitively. Only declared fields are kept, each cast once from its
+    highest-priority value, since `model_construct` performs no checks.
+    """
+    coerced: Dict[str, Any] = {}
+    for source in sources:
+        for key, value in source.items():
+            name = key.lower()
+            if value is None or name in coerced:
+                continue
+            coercer = _FIELD_COERCERS.get(name)
+            if coercer is not None:
+                coerced[name] = coercer(value)
+    return coerced
+
+
 class PydanticSettings:
     """
     Core class for managing settings, configurations, and secrets.
@@ -37,6 +320,9 @@ class PydanticSettings:
         self.secret_key_file: str = "secret.key"
         self.environment: str = os.getenv("ENVIRONMENT", "Development")
         self.config: Dict[str, Any] = {}
+        self._aead: Optional["AESGCM"] = None
+        self._key: Optional[bytes] = None
+        self._key_stamp: Optional[Tuple[str, int]] = None
 
     def set_environment(self, environment: str):
         """
@@ -44,17 +330,92 @@ class PydanticSettings:
         """
         self.environment = environment
 
+    def _get_cipher(self) -> "AESGCM":
+        """
+        Return an AES-256-GCM cipher for the secret key, rebuilding it only when the key file changes.
+        """
+        from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+
+        stamp = (self.secret_key_file, os.stat(self.secret_key_file).st_mtime_ns)
+        if self._aead is None or stamp != self._key_stamp:
+            self._key = _read_file_bytes(self.secret_key_file)
+            self._aead = AESGCM(base64.urlsafe_b64decode(self._key))
+            self._key_stamp = stamp
+        return self._aead
+
+    def _encrypt(self, data: bytes) -> bytes:
+        """
+        Encrypt data with AES-GCM under a fresh random nonce, returned as `nonce || ciphertext`.
+        """
+        nonce = os.urandom(_NONCE_SIZE)
+        return nonce + self._get_cipher().encrypt(nonce, data, None)
+
+    def _decrypt(self, token: bytes) -> bytes:
+        """
+        Decrypt data produced by `_encrypt`, or a legacy Fernet token made with the same key.
+        """
+        from cryptography.exceptions import InvalidTag
+
+        aead = self._get_cipher()
+        try:
+            return aead.decrypt(token[:_NONCE_SIZE], token[_NONCE_SIZE:], None)
+        except InvalidTag:
+            if not token.startswith(_FERNET_PREFIX):
+                raise
+
+        from cryptography.fernet import Fernet
+
+        return Fernet(self._key).decrypt(token)
+
+    def generate_schema(self, env_vars: Dict[str, Any]) -> SchemaValidator:
+        """
+        Build (or reuse) a validator for the `EnvironmentSettings` fields set in an `.env` file.
+
+        Only declared fields are validated, with their annotated types; other keys
+        are ignored. Validators are cached per set of fields present, so files that
+        set the same fields share one compiled pydantic-core schema.
+
+        Args:
+            env_vars (dict): Parsed `.env` key/value pairs.
+
+        Returns:
+            SchemaValidator: Compiled validator for the fields present.
+        """
+        shape = frozenset(
+            name for name in (key.lower() for key in env_vars) if name in EnvironmentSettings.model_fields
+        )
+        validator = _VALIDATOR_CACHE.get(shape)
+        if validator is None:
+            fields = {
+                name: (EnvironmentSettings.model_fields[name].annotation, ...) for name in sorted(shape)
+            }
+            model = create_model("EnvFileSchema", **fields)
+            validator = _VALIDATOR_CACHE[shape] = model.__pydantic_validator__
+        return validator
+
+    def validate_env_vars(self, env_vars: Dict[str, Any], schema: SchemaValidator) -> None:
+        """
+        Validate the `EnvironmentSettings` fields of an `.env` file against a validator
+        from `generate_schema`.
+
+        Raises:
+            ValidationError: If any value does not match its field type.
+        """
+        fields = EnvironmentSettings.model_fields
+        schema.validate_python(
+            {key.lower(): value for key, value in env_vars.items() if key.lower() in fields}
+        )
+
     async def load_config(self) -> Dict[str, Any]:
         """
         Load configurations from YAML and JSON files.
         """
-        if os.path.exists(self.yaml_file):
-            with open(self.yaml_file, "r") as file:
-                self.config.update(yaml.safe_load(file))
-
-        if os.path.exists(self.json_file):
-            with open(self.json_file, "r") as file:
-                self.config.update(json.load(file))
+        for path, parse in ((self.yaml_file, _parse_yaml), (self.json_file, _parse_json)):
+            try:
+                parsed = await _run_in_thread(parse, path)
+            except FileNotFoundError:
+                continue
+            self.config.update(parsed)
 
         return self.config
 
@@ -67,32 +428,22 @@ class PydanticSettings:
 
         if secrets_client_name == "secretsmanager":
             try:
-                import boto3  # type: ignore
-                client = boto3.client("secretsmanager")
+                client = _boto_client()
                 secret_id = os.getenv("AWS_SECRET_ID", "MyAppSecrets")
-                secrets = json.loads(client.get_secret_value(SecretId=secret_id)["SecretString"])
+                response = await _run_in_thread(client.get_secret_value, SecretId=secret_id)
+                secrets = json.loads(response["SecretString"])
                 logger.info("Loaded secrets from AWS Secrets Manager.")
             except ImportError:
                 logger.info("boto3 not installed. AWS Secrets Manager functionality will not be available.")
         elif secrets_client_name == "keyvault":
             try:
-                from azure.keyvault.secrets import SecretClient  # type: ignore
-                from azure.identity import DefaultAzureCredential  # type: ignore
-                vault_url = os.getenv("AZURE_VAULT_URL")
-                client = SecretClient(vault_url=vault_url, credential=DefaultAzureCredential())
-                secrets = {secret.name: secret.value for secret in client.list_properties_of_secrets()}
+                secrets = await _fetch_azure_secrets(os.getenv("AZURE_VAULT_URL"))
                 logger.info("Loaded secrets from Azure Key Vault.")
             except ImportError:
                 logger.info("Azure Key Vault libraries not installed. Azure functionality will not be available.")
         elif secrets_client_name == "google_secret_manager":
             try:
-                from google.cloud import secretmanager  # type: ignore
-                client = secretmanager.SecretManagerServiceClient()
-                project_id = os.getenv("GOOGLE_PROJECT_ID")
-                secrets = {
-                    secret.name: secret.payload.data.decode("UTF-8")
-                    for secret in client.list_secrets(parent=f"projects/{project_id}")
-                }
+                secrets = await _fetch_google_secrets(os.getenv("GOOGLE_PROJECT_ID"))
                 logger.info("Loaded secrets from Google Secret Manager.")
             except ImportError:
                 logger.info("Google Cloud Secret Manager libraries not installed. Google functionality will not be available.")
@@ -103,30 +454,54 @@ class PydanticSettings:
 
         return secrets
 
-    async def load_encrypted_env(self) -> Dict[str, str]:
+    async def load_encrypted_env(self) -> Dict[str, Optional[str]]:
         """
         Load and decrypt encrypted environment variables.
+
+        The decrypted blob is parsed with the same dotenv parser as a plain `.env` file.
+        """
+        return await _run_in_thread(self._read_encrypted_env)
+
+    def _read_encrypted_env(self) -> Dict[str, Optional[str]]:
+        """
+        Blocking part of `load_encrypted_env`: read, decrypt and parse the encrypted file.
         """
-        with open(self.secret_key_file, "rb") as key_file:
-            key = key_file.read()
-        fernet = Fernet(key)
-        with open(self.encrypted_env_file, "rb") as file:
-            decrypted_data = fernet.decrypt(file.read())
-        return dict(line.split("=") for line in decrypted_data.decode().splitlines())
+        from dotenv import dotenv_values
 
-    async def load_env(self) -> EnvironmentSettings:
+        decrypted_data = self._decrypt(_read_file_bytes(self.encrypted_env_file))
+        return dict(dotenv_values(stream=io.StringIO(decrypted_data.decode("utf-8"))))
+
+    async def load_env(self, trusted: Optional[bool] = None) -> EnvironmentSettings:
         """
         Load and merge configurations from `.env`, YAML, JSON, and secrets.
 
+        Settings are validated by default. In trusted mode they are built with
+        `model_construct` and cheap per-field casts instead, which skips Pydantic
+        validation entirely: values that cannot be cast raise a plain `ValueError`,
+        anything else (constraints, validators, unknown keys) is not checked, and
+        the process environment is not read. Only enable it for sources that were
+        already validated, e.g. by `validate-env` in CI.
+
+        Args:
+            trusted (bool, optional): Force trusted (`True`) or validating (`False`)
+                mode. Defaults to trusted only when `PYDANTIC_SETTINGS_TRUSTED=1`
+                was set when the module was imported.
+
         Returns:
-            EnvironmentSettings: Parsed and validated environment settings.
+            EnvironmentSettings: Parsed environment settings.
         """
-        env_vars = dotenv_values(".env")
-        await self.load_config()
-        secrets = await self.fetch_secrets()
+        env_vars, _, secrets = await asyncio.gather(
+            _run_in_thread(_parse_dotenv, ".env"),
+            self.load_config(),
+            self.fetch_secrets(),
+        )
 
-        merged_settings = {**env_vars, **self.config, **secrets}
-        return EnvironmentSettings(**merged_settings)
+        sources = (secrets, self.config, env_vars)  # highest priority first
+        if _TRUSTED if trusted is None else trusted:
+            return EnvironmentSettings.model_construct(**_coerce_trusted(*sources))
+        # `.env` is already among the sources (via the mtime cache); don't let
+        # `BaseSettings` parse it again through `Config.env_file`.
+        return EnvironmentSettings(_env_file=None, **_fold_case(*sources))
 
     def encrypt_env_file(self, env_file: str = ".env"):
         """
@@ -135,30 +510,31 @@ class PydanticSettings:
         Args:
             env_file (str): Path to the `.env` file to encrypt.
         """
-        if not os.path.exists(env_file):
+        try:
+            env_data = _read_file_bytes(env_file)
+        except FileNotFoundError:
             logger.error(f"File '{env_file}' does not exist.")
             return
 
-        # Generate a key if it doesn't exist
-        if not os.path.exists(self.secret_key_file):
-            key = Fernet.generate_key()
+        try:
+            encrypted_data = self._encrypt(env_data)
+        except FileNotFoundError:
+            # Generate a key if it doesn't exist
+            from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+
+            key = base64.urlsafe_b64encode(AESGCM.generate_key(bit_length=256))
             with open(self.secret_key_file, "wb") as key_file:
                 key_file.write(key)
             logger.info(f"Encryption key generated and saved to '{self.secret_key_file}'.")
-
-        # Read the key
-        with open(self.secret_key_file, "rb") as key_file:
-            key = key_file.read()
-
-        # Read and encrypt the .env file
-        with open(env_file, "r") as file:
-            env_data = file.read()
-
-        fernet = Fernet(key)
-        encrypted_data = fernet.encrypt(env_data.encode())
+            encrypted_data = self._encrypt(env_data)
 
         # Save encrypted data to the encrypted_env_file
         with open(self.encrypted_env_file, "wb") as encrypted_file:
             encrypted_file.write(encrypted_data)
 
+        _parse_dotenv_cached.cache_clear()
         logger.info(f"File '{env_file}' encrypted and saved as '{self.encrypted_env_file}'.")
+
+
+# Singleton instance for easier import
+pydantic_settings = PydanticSettings()
@@ -1,5 +1,4 @@
 import os
-from .core import pydantic_settings
 
 class PydanticSettingsHelp:
     """
@@ -123,6 +122,8 @@ For additional documentation, visit the official repository or contact support.
         Returns:
             str: Help text including real-time details of the user's configuration.
         """
+        from .core import pydantic_settings
+
         current_profile = pydantic_settings.environment
         secrets_manager = (
             os.getenv("SECRETS_MANAGER", "Not configured")
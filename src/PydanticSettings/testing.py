@@ -1,9 +1,10 @@
 import asyncio
 import os
+from contextlib import asynccontextmanager
 from unittest.mock import AsyncMock, patch
-from typing import Dict, Any, AsyncGenerator
+from typing import Dict, Any, AsyncIterator
 from pydantic import ValidationError
-from core import PydanticSettings, EnvironmentSettings
+from .core import PydanticSettings, EnvironmentSettings
 
 
 class AsyncUnitTestingUtilities:
@@ -12,18 +13,29 @@ class AsyncUnitTestingUtilities:
     """
 
     @staticmethod
-    async def mock_env_vars(env: Dict[str, Any]) -> AsyncGenerator[None, None]:
+    @asynccontextmanager
+    async def mock_env_vars(env: Dict[str, Any]) -> AsyncIterator[None]:
         """
         Async context manager to mock environment variables.
 
+        Only the keys in `env` are saved and restored on exit.
+
         Args:
             env (dict): Dictionary of environment variables to mock.
 
         Yields:
             None: Mocks the environment variables within the context.
         """
-        with patch.dict("os.environ", env):
+        saved = {key: os.environ.get(key) for key in env}
+        try:
+            os.environ.update(env)
             yield
+        finally:
+            for key, value in saved.items():
+                if value is None:
+                    os.environ.pop(key, None)
+                else:
+                    os.environ[key] = value
 
     @staticmethod
     async def validate_settings(settings_class: Any, env_vars: Dict[str, Any]) -> bool:
@@ -47,7 +59,8 @@ class AsyncUnitTestingUtilities:
                 raise e
 
     @staticmethod
-    async def simulate_profile_switch(pydantic_settings_instance: PydanticSettings, profile: str) -> AsyncGenerator[None, None]:
+    @asynccontextmanager
+    async def simulate_profile_switch(pydantic_settings_instance: PydanticSettings, profile: str) -> AsyncIterator[None]:
         """
         Async context manager to simulate switching environment profiles and test their effects.
 
@@ -67,7 +80,8 @@ class AsyncUnitTestingUtilities:
             pydantic_settings_instance.set_environment(original_profile)
 
     @staticmethod
-    async def mock_secrets_manager(secrets: Dict[str, Any]) -> AsyncGenerator[None, None]:
+    @asynccontextmanager
+    async def mock_secrets_manager(secrets: Dict[str, Any]) -> AsyncIterator[None]:
         """
         Mock secrets manager asynchronously for testing secret retrieval.
 
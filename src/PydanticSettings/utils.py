@@ -1,5 +1,26 @@
 import json
-import yaml
+
+
+def _export_json(settings: dict) -> str:
+    return json.dumps(settings, indent=2)
+
+
+def _export_yaml(settings: dict) -> str:
+    import yaml
+
+    try:
+        from yaml import CSafeDumper as Dumper
+    except ImportError:  # libyaml not available
+        from yaml import SafeDumper as Dumper  # type: ignore
+
+    return yaml.dump(settings, Dumper=Dumper, default_flow_style=False)
+
+
+_EXPORTERS = {
+    "json": _export_json,
+    "yaml": _export_yaml,
+}
+
 
 def export_settings(settings: dict, format: str = "json") -> str:
     """
@@ -12,9 +33,8 @@ def export_settings(settings: dict, format: str = "json") -> str:
     Returns:
         str: Exported settings as a string.
     """
-    if format == "json":
-        return json.dumps(settings, indent=2)
-    elif format == "yaml":
-        return yaml.dump(settings, default_flow_style=False)
-    else:
-        raise ValueError("Unsupported format. Use 'json' or 'yaml'.")
+    try:
+        exporter = _EXPORTERS[format]
+    except KeyError:
+        raise ValueError("Unsupported format. Use 'json' or 'yaml'.") from None
+    return exporter(settings)
@@ -0,0 +1,81 @@
+import asyncio
+import math
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from PydanticSettings.core import PydanticSettings
+
+
+def _load_env_trusted(env_vars, config=None, secrets=None):
+    """Run `load_env(trusted=True)` against in-memory sources instead of files and secrets managers."""
+    instance = PydanticSettings()
+    instance.config = config or {}
+
+    with patch("PydanticSettings.core._parse_dotenv", return_value=env_vars), \
+            patch.object(instance, "load_config", AsyncMock(return_value=instance.config)), \
+            patch.object(instance, "fetch_secrets", AsyncMock(return_value=secrets or {})):
+        return asyncio.run(instance.load_env(trusted=True))
+
+
+def test_load_env_trusted_prefers_secrets_over_config_and_env_file():
+    settings = _load_env_trusted({"PORT": "3"}, config={"port": 2}, secrets={"PORT": "1"})
+
+    assert settings.port == 1
+
+
+def test_load_env_trusted_prefers_config_over_env_file():
+    settings = _load_env_trusted({"debug": "false"}, config={"DEBUG": "true"})
+
+    assert settings.debug is True
+
+
+def test_load_env_trusted_rejects_unknown_boolean_strings():
+    with pytest.raises(ValueError):
+        _load_env_trusted({"DEBUG": "maybe"})
+
+
+def test_load_config_parses_json_like_the_stdlib(tmp_path):
+    json_file = tmp_path / "config.json"
+    json_file.write_text('{"big": 123456789012345678901234567890, "ratio": NaN}')
+    instance = PydanticSettings()
+    instance.yaml_file = str(tmp_path / "missing.yaml")
+    instance.json_file = str(json_file)
+
+    config = asyncio.run(instance.load_config())
+
+    assert config["big"] == 123456789012345678901234567890
+    assert math.isnan(config["ratio"])
+
+
+def test_load_config_does_not_share_nested_values_with_the_parse_cache(tmp_path):
+    yaml_file = tmp_path / "config.yaml"
+    yaml_file.write_text("db:\n  host: localhost\n")
+    first = PydanticSettings()
+    first.yaml_file = str(yaml_file)
+    first.json_file = str(tmp_path / "missing.json")
+    second = PydanticSettings()
+    second.yaml_file = first.yaml_file
+    second.json_file = first.json_file
+
+    asyncio.run(first.load_config())["db"]["host"] = "mutated"
+
+    assert asyncio.run(second.load_config())["db"]["host"] == "localhost"
+
+
+@pytest.mark.parametrize("port", [8080.9, True])
+def test_load_env_trusted_rejects_lossy_integer_casts(port):
+    with pytest.raises(ValueError):
+        _load_env_trusted({}, config={"port": port})
+
+
+def test_generate_schema_ignores_undeclared_keys_and_reuses_validators():
+    instance = PydanticSettings()
+    env_vars = {"MODEL_CONFIG": "x", "JSON": "y", "PORT": "80"}
+
+    validator = instance.generate_schema(env_vars)
+    instance.validate_env_vars(env_vars, validator)
+
+    assert instance.generate_schema({"port": "81", "OTHER": "z"}) is validator
+    with pytest.raises(ValueError):
+        instance.validate_env_vars({"PORT": "abc"}, validator)
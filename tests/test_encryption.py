@@ -0,0 +1,86 @@
+import asyncio
+import base64
+
+import pytest
+from cryptography.exceptions import InvalidTag
+from cryptography.fernet import Fernet
+
+from PydanticSettings.core import _FERNET_PREFIX, PydanticSettings
+
+
+def _instance(tmp_path):
+    instance = PydanticSettings()
+    instance.secret_key_file = str(tmp_path / "secret.key")
+    instance.encrypted_env_file = str(tmp_path / ".env.encrypted")
+    return instance
+
+
+def test_encrypted_env_is_parsed_like_a_plain_env_file(tmp_path):
+    env_file = tmp_path / ".env"
+    env_file.write_bytes(
+        b"EQUALS=a=b\r\n"
+        b"CRLF=value\r\n"
+        b'QUOTED="quoted value"\r\n'
+        b"export EXPORTED=1\r\n"
+        b"COMMENTED=v # note\r\n"
+    )
+    instance = _instance(tmp_path)
+
+    instance.encrypt_env_file(str(env_file))
+    secrets = asyncio.run(instance.load_encrypted_env())
+
+    assert secrets == {
+        "EQUALS": "a=b",
+        "CRLF": "value",
+        "QUOTED": "quoted value",
+        "EXPORTED": "1",
+        "COMMENTED": "v",
+    }
+
+
+def test_encrypt_env_file_round_trips_with_aes_gcm(tmp_path):
+    env_file = tmp_path / ".env"
+    env_file.write_text("API_KEY=secret\n")
+    instance = _instance(tmp_path)
+
+    instance.encrypt_env_file(str(env_file))
+
+    encrypted = (tmp_path / ".env.encrypted").read_bytes()
+    assert b"secret" not in encrypted
+    assert not encrypted.startswith(_FERNET_PREFIX)
+    assert asyncio.run(instance.load_encrypted_env()) == {"API_KEY": "secret"}
+
+
+def test_encrypt_env_file_generates_a_missing_key(tmp_path):
+    env_file = tmp_path / ".env"
+    env_file.write_text("API_KEY=secret\n")
+    instance = _instance(tmp_path)
+    assert not (tmp_path / "secret.key").exists()
+
+    instance.encrypt_env_file(str(env_file))
+
+    key = (tmp_path / "secret.key").read_bytes()
+    assert len(base64.urlsafe_b64decode(key)) == 32
+    assert asyncio.run(_instance(tmp_path).load_encrypted_env()) == {"API_KEY": "secret"}
+
+
+def test_load_encrypted_env_reads_legacy_fernet_files(tmp_path):
+    key = Fernet.generate_key()
+    (tmp_path / "secret.key").write_bytes(key)
+    (tmp_path / ".env.encrypted").write_bytes(Fernet(key).encrypt(b"API_KEY=secret\n"))
+
+    assert asyncio.run(_instance(tmp_path).load_encrypted_env()) == {"API_KEY": "secret"}
+
+
+def test_load_encrypted_env_rejects_a_tampered_file(tmp_path):
+    env_file = tmp_path / ".env"
+    env_file.write_text("API_KEY=secret\n")
+    instance = _instance(tmp_path)
+    instance.encrypt_env_file(str(env_file))
+    encrypted_file = tmp_path / ".env.encrypted"
+    data = bytearray(encrypted_file.read_bytes())
+    data[-1] ^= 0x01
+    encrypted_file.write_bytes(bytes(data))
+
+    with pytest.raises(InvalidTag):
+        asyncio.run(instance.load_encrypted_env())